@@ -5,83 +5,67 @@ Shows which files will be included/excluded from your GitHub repository
 """
 
 import os
+import re
 import subprocess
 from pathlib import Path
 
+def _git_ls_files(*args):
+    """Run `git ls-files` and return the NUL-separated paths it prints"""
+    output = subprocess.check_output(['git', 'ls-files', '-z', *args], text=True)
+    return [path for path in output.split('\0') if path]
+
 def get_git_status():
     """Get list of files that will be tracked by Git"""
     try:
-        # Get all files in the directory
-        all_files = []
-        for root, dirs, files in os.walk('.'):
-            # Skip .git directory
-            if '.git' in root:
-                continue
-            for file in files:
-                file_path = os.path.join(root, file)
-                all_files.append(file_path)
-        
-        # Check which files Git will track
-        tracked_files = []
-        untracked_files = []
-        
-        for file_path in all_files:
-            try:
-                result = subprocess.run(
-                    ['git', 'check-ignore', file_path], 
-                    capture_output=True, 
-                    text=True
-                )
-                if result.returncode == 0:
-                    # File is ignored
-                    untracked_files.append(file_path)
-                else:
-                    # File will be tracked
-                    tracked_files.append(file_path)
-            except:
-                # If git check-ignore fails, assume file will be tracked
-                tracked_files.append(file_path)
+        # Let Git enumerate the tree itself: tracked files plus untracked
+        # files that are not ignored will be uploaded, the rest is excluded.
+        # --directory reports a fully ignored folder (.venv/, node_modules/)
+        # as a single entry instead of descending into it.
+        tracked_files = _git_ls_files('--cached', '--others', '--exclude-standard')
+        untracked_files = _git_ls_files(
+            '--others', '--ignored', '--exclude-standard', '--directory'
+        )
         
         return tracked_files, untracked_files
     except Exception as e:
         print(f"Error checking Git status: {e}")
         return [], []
 
+ESSENTIAL_PATTERNS = [
+    'main.py',
+    'requirements.txt',
+    'Dockerfile',
+    'render.yaml',
+    'study_time_model.pkl',
+    'study_api_client.py',
+    'README.md',
+    'DEPLOYMENT.md',
+    'RENDER_DEPLOYMENT_GUIDE.md'
+]
+
+USEFUL_PATTERNS = [
+    '.github/',
+    'test_',
+    'setup_',
+    'deploy.py',
+    'docker-compose.yml',
+    'Procfile'
+]
+
+# Each pattern list compiled into one alternation so a path is scanned once
+ESSENTIAL_RE = re.compile('|'.join(map(re.escape, ESSENTIAL_PATTERNS)))
+USEFUL_RE = re.compile('|'.join(map(re.escape, USEFUL_PATTERNS)))
+
 def categorize_files(files):
     """Categorize files by importance for Render deployment"""
     essential = []
     useful = []
     optional = []
     
-    essential_patterns = [
-        'main.py',
-        'requirements.txt',
-        'Dockerfile',
-        'render.yaml',
-        'study_time_model.pkl',
-        'study_api_client.py',
-        'README.md',
-        'DEPLOYMENT.md',
-        'RENDER_DEPLOYMENT_GUIDE.md'
-    ]
-    
-    useful_patterns = [
-        '.github/',
-        'test_',
-        'setup_',
-        'deploy.py',
-        'docker-compose.yml',
-        'Procfile'
-    ]
-    
     for file_path in files:
-        file_name = os.path.basename(file_path)
-        is_essential = any(pattern in file_path for pattern in essential_patterns)
-        is_useful = any(pattern in file_path for pattern in useful_patterns)
-        
-        if is_essential:
+        if ESSENTIAL_RE.search(file_path):
             essential.append(file_path)
-        elif is_useful:
+        elif USEFUL_RE.search(file_path):
             useful.append(file_path)
         else:
             optional.append(file_path)
@@ -94,7 +78,12 @@ def main():
     
     # Check if this is a Git repository
     try:
-        subprocess.run(['git', 'status'], capture_output=True, check=True)
+        # rev-parse answers without scanning the working tree like `git status`
+        subprocess.run(
+            ['git', 'rev-parse', '--is-inside-work-tree', '--show-toplevel'],
+            capture_output=True,
+            check=True
+        )
         print("✅ Git repository found")
     except:
         print("❌ Not a Git repository. Run 'git init' first.")
@@ -128,12 +117,12 @@ def main():
     for file_path in sorted(optional):
         print(f"📄 {file_path}")
     
-    print(f"\n🚫 Files excluded by .gitignore ({len(untracked_files)} files):")
+    print(f"\n🚫 Files and folders excluded by .gitignore ({len(untracked_files)} entries):")
     print("-" * 40)
     for file_path in sorted(untracked_files)[:10]:  # Show first 10
         print(f"❌ {file_path}")
     if len(untracked_files) > 10:
-        print(f"... and {len(untracked_files) - 10} more files")
+        print(f"... and {len(untracked_files) - 10} more entries")
     
     # Check for critical missing files
     critical_files = [
@@ -143,10 +132,8 @@ def main():
         'study_time_model.pkl'
     ]
     
-    missing_critical = []
-    for file in critical_files:
-        if not any(file in f for f in tracked_files):
-            missing_critical.append(file)
+    tracked_basenames = frozenset(os.path.basename(f) for f in tracked_files)
+    missing_critical = [f for f in critical_files if f not in tracked_basenames]
     
     print(f"\n🔍 Deployment Readiness Check:")
     print("=" * 40)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+ONNX Model Conversion Script
+Converts study_time_model.pkl into study_time_model.onnx for ONNX Runtime serving
+"""
+
+import os
+import sys
+import joblib
+import numpy as np
+
+PKL_PATH = "study_time_model.pkl"
+ONNX_PATH = "study_time_model.onnx"
+
+def convert_model():
+    """Convert the scikit-learn model to ONNX format"""
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+    except ImportError:
+        print("❌ skl2onnx not installed")
+        print("   Run: pip install skl2onnx onnxruntime")
+        return None
+
+    model = joblib.load(PKL_PATH)
+    n_features = getattr(model, 'n_features_in_', 13)
+    print(f"✅ Loaded {type(model).__name__} with {n_features} features")
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('input', FloatTensorType([None, n_features]))]
+    )
+    with open(ONNX_PATH, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+
+    pkl_mb = os.path.getsize(PKL_PATH) / (1024 * 1024)
+    onnx_mb = os.path.getsize(ONNX_PATH) / (1024 * 1024)
+    print(f"✅ Saved {ONNX_PATH} ({onnx_mb:.2f} MB, pickle was {pkl_mb:.2f} MB)")
+    return model
+
+def verify_model(model):
+    """Compare ONNX Runtime predictions against the original model"""
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        print("⚠️  onnxruntime not installed, skipping verification")
+        return True
+
+    session = ort.InferenceSession(ONNX_PATH, providers=['CPUExecutionProvider'])
+    input_name = session.get_inputs()[0].name
+
+    X = np.random.randint(0, 5, size=(100, model.n_features_in_)).astype(np.float32)
+    expected = model.predict(X)
+    actual = session.run(None, {input_name: X})[0].ravel()
+
+    max_diff = float(np.max(np.abs(expected - actual)))
+    if max_diff < 1e-3:
+        print(f"✅ Predictions match (max difference {max_diff:.2e})")
+        return True
+
+    print(f"❌ Predictions differ (max difference {max_diff:.2e})")
+    return False
+
+def main():
+    print("🔄 Converting model to ONNX")
+    print("=" * 40)
+
+    if not os.path.exists(PKL_PATH):
+        print(f"❌ {PKL_PATH} not found")
+        sys.exit(1)
+
+    model = convert_model()
+    if model is None or not verify_model(model):
+        sys.exit(1)
+
+    print("\n🚀 main.py will now serve the ONNX model when onnxruntime is installed:")
+    print("   pip install onnxruntime")
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,23 @@ Study Time Prediction API Deployment Script
 
 import os
 import sys
+import asyncio
+import functools
 import subprocess
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
 class APIDeployer:
     def __init__(self):
         self.project_dir = Path.cwd()
         self.api_url = None
+        # One session so consecutive test requests reuse the same connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
     def check_dependencies(self):
         """Check if required files exist"""
@@ -32,16 +40,34 @@ class APIDeployer:
         return True
     
     def deploy_local(self):
-        """Deploy locally using uvicorn"""
+        """Deploy locally using gunicorn with uvicorn workers"""
         print("🚀 Deploying API locally...")
-        try:
-            subprocess.run([
+        if os.name == "nt":
+            # Gunicorn does not run on Windows; fall back to plain uvicorn workers
+            command = [
                 sys.executable, "-m", "uvicorn", 
                 "main:app", 
                 "--host", "0.0.0.0", 
                 "--port", "8000",
                 "--workers", "4"
-            ], check=True)
+            ]
+        else:
+            # --preload loads the model once in the master so the forked
+            # workers share its memory; uvicorn workers pick up uvloop and
+            # httptools automatically
+            command = [
+                sys.executable, "-m", "gunicorn",
+                "-k", "uvicorn.workers.UvicornWorker",
+                "--preload",
+                "-w", "4",
+                "-b", "0.0.0.0:8000",
+                "main:app"
+            ]
+            # Keep worker heartbeat files in RAM where available (not on macOS)
+            if os.path.isdir("/dev/shm"):
+                command[-1:-1] = ["--worker-tmp-dir", "/dev/shm"]
+        try:
+            subprocess.run(command, check=True)
         except KeyboardInterrupt:
             print("\n👋 Local deployment stopped.")
         except Exception as e:
@@ -51,26 +77,61 @@ class APIDeployer:
         """Deploy using Docker"""
         print("🐳 Deploying API with Docker...")
         try:
-            # Build Docker image
-            subprocess.run(["docker", "build", "-t", "study-api", "."], check=True)
-            print("✅ Docker image built successfully!")
-            
-            # Run container
-            subprocess.run([
-                "docker", "run", "-d",
-                "--name", "study-api-container",
-                "-p", "8000:8000",
-                "-v", f"{self.project_dir}/study_time_model.pkl:/app/study_time_model.pkl:ro",
-                "study-api"
-            ], check=True)
-            print("✅ Docker container started!")
-            print("🌐 API available at: http://localhost:8000")
-            
+            asyncio.run(self._deploy_docker())
         except subprocess.CalledProcessError as e:
             print(f"❌ Docker deployment failed: {e}")
         except FileNotFoundError:
             print("❌ Docker not found. Please install Docker first.")
     
+    async def _deploy_docker(self):
+        """Build and start the container, then poll it until healthy"""
+        # Start the build (its logs stream straight to the terminal) and
+        # prepare the run command while it is in progress
+        build = asyncio.create_task(
+            self._run_command("docker", "build", "-t", "study-api", ".")
+        )
+        run_command = [
+            "docker", "run", "-d",
+            "--name", "study-api-container",
+            "-p", "8000:8000",
+            "-v", f"{self.project_dir}/study_time_model.pkl:/app/study_time_model.pkl:ro",
+            "study-api"
+        ]
+        await build
+        print("✅ Docker image built successfully!")
+        
+        await self._run_command(*run_command)
+        print("✅ Docker container started!")
+        
+        if await self._wait_until_healthy("http://localhost:8000"):
+            print("🌐 API available at: http://localhost:8000")
+        else:
+            print("⚠️  Container started but /health is not responding yet.")
+            print("   Check logs with: docker logs study-api-container")
+    
+    async def _run_command(self, *command):
+        """Run a command asynchronously and raise if it fails"""
+        process = await asyncio.create_subprocess_exec(*command)
+        returncode = await process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+    
+    async def _wait_until_healthy(self, url, timeout=60, interval=0.2):
+        """Poll the /health endpoint until it answers or the timeout elapses"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                response = await loop.run_in_executor(
+                    None, functools.partial(self.session.get, f"{url}/health", timeout=2)
+                )
+                if response.status_code == 200:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            await asyncio.sleep(interval)
+        return False
+    
     def deploy_docker_compose(self):
         """Deploy using Docker Compose"""
         print("🐳 Deploying API with Docker Compose...")
@@ -89,7 +150,7 @@ class APIDeployer:
         print(f"🧪 Testing deployment at {url}...")
         try:
             # Test health endpoint
-            health_response = requests.get(f"{url}/health", timeout=10)
+            health_response = self.session.get(f"{url}/health", timeout=10)
             if health_response.status_code == 200:
                 print("✅ Health check passed!")
                 
@@ -101,7 +162,7 @@ class APIDeployer:
                     "traveltime": 2, "health": 5, "internet": 1, "age": 17
                 }
                 
-                pred_response = requests.post(
+                pred_response = self.session.post(
                     f"{url}/predict", 
                     json=test_data, 
                     timeout=10
@@ -133,16 +194,17 @@ class APIDeployer:
 class StudyTimeAPI:
     def __init__(self, base_url="{base_url}"):
         self.base_url = base_url
+        self.session = requests.Session()
     
     def predict_study_time(self, **features):
         """Predict study time based on student features"""
-        response = requests.post(f"{{self.base_url}}/predict", json=features)
+        response = self.session.post(f"{{self.base_url}}/predict", json=features)
         response.raise_for_status()
         return response.json()
     
     def health_check(self):
         """Check API health"""
-        response = requests.get(f"{{self.base_url}}/health")
+        response = self.session.get(f"{{self.base_url}}/health")
         response.raise_for_status()
         return response.json()
 
@@ -217,7 +279,7 @@ def main():
         sys.exit(1)
     
     print("\n📋 Deployment Options:")
-    print("1. Local deployment (uvicorn)")
+    print("1. Local deployment (gunicorn + uvicorn workers)")
     print("2. Docker deployment")
     print("3. Docker Compose deployment")
     print("4. Generate client code")
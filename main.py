@@ -1,40 +1,87 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from typing import Annotated, List
 import joblib
 import numpy as np
-import pandas as pd
-import random
 import os
+import time
+import asyncio
+import contextlib
+import functools
+import itertools
+import operator
 from sklearn.ensemble import RandomForestRegressor
 
-# Load saved model with error handling
 try:
-    model = joblib.load("study_time_model.pkl")
-    model_loaded = True
-    print("✅ Model loaded successfully!")
-except FileNotFoundError:
-    print("⚠️  Warning: study_time_model.pkl not found. Please ensure your trained model is in the project root.")
-    model_loaded = False
-    model = None
-except Exception as e:
-    print(f"⚠️  Error loading model: {str(e)}")
-    print("🔄 Creating a mock model for testing purposes...")
-    
-    # Create a simple mock model for testing
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+MODEL_PATH = "study_time_model.pkl"
+ONNX_MODEL_PATH = "study_time_model.onnx"
+
+class OnnxModel:
+    """ONNX Runtime session exposed through the scikit-learn predict() interface"""
+
+    def __init__(self, path):
+        options = ort.SessionOptions()
+        # Batches are small; one thread per session avoids oversubscribing workers
+        options.intra_op_num_threads = 1
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        try:
+            return self.session.run(None, {self.input_name: X})[0].ravel()
+        except Exception as e:
+            # onnxruntime's InvalidArgument/Fail do not derive from ValueError;
+            # re-raise so bad input is reported like scikit-learn's errors
+            raise ValueError(str(e)) from e
+
+model = None
+model_loaded = False
+
+# Prefer the converted ONNX model when available (see convert_model_to_onnx.py)
+if ort is not None and os.path.exists(ONNX_MODEL_PATH):
     try:
-        mock_model = RandomForestRegressor(n_estimators=10, random_state=42)
-        # Train on dummy data
-        X_dummy = np.random.rand(100, 13)  # 13 features
-        y_dummy = np.random.uniform(0.5, 4.0, 100)  # Study time between 0.5-4 hours
-        mock_model.fit(X_dummy, y_dummy)
-        
-        model = mock_model
+        model = OnnxModel(ONNX_MODEL_PATH)
+        model_loaded = True
+        print("✅ ONNX model loaded successfully!")
+    except Exception as e:
+        print(f"⚠️  Error loading ONNX model: {str(e)}")
+        model = None
+
+# Load saved model with error handling
+if model is None:
+    try:
+        model = joblib.load(MODEL_PATH)
         model_loaded = True
-        print("✅ Mock model created and loaded for testing!")
-    except Exception as mock_error:
-        print(f"❌ Failed to create mock model: {mock_error}")
+        print("✅ Model loaded successfully!")
+    except FileNotFoundError:
+        print("⚠️  Warning: study_time_model.pkl not found. Please ensure your trained model is in the project root.")
         model_loaded = False
         model = None
+    except Exception as e:
+        print(f"⚠️  Error loading model: {str(e)}")
+        print("🔄 Creating a mock model for testing purposes...")
+    
+        # Create a simple mock model for testing
+        try:
+            mock_model = RandomForestRegressor(n_estimators=10, random_state=42)
+            # Train on dummy data
+            X_dummy = np.random.rand(100, 13)  # 13 features
+            y_dummy = np.random.uniform(0.5, 4.0, 100)  # Study time between 0.5-4 hours
+            mock_model.fit(X_dummy, y_dummy)
+        
+            model = mock_model
+            model_loaded = True
+            print("✅ Mock model created and loaded for testing!")
+        except Exception as mock_error:
+            print(f"❌ Failed to create mock model: {mock_error}")
+            model_loaded = False
+            model = None
 
 # Define input schema
 class StudyTimeInput(BaseModel):
@@ -52,63 +99,205 @@ class StudyTimeInput(BaseModel):
     internet: int
     age: int
 
+# Feature column order passed to the model. Rows are plain arrays, so
+# scikit-learn cannot check column names; take the order the model was fit
+# with when it records one, otherwise fall back to StudyTimeInput's order
+_FEATURE_ORDER = tuple(StudyTimeInput.model_fields)
+if hasattr(model, "feature_names_in_"):
+    unknown_features = set(model.feature_names_in_).difference(_FEATURE_ORDER)
+    if unknown_features:
+        print(f"❌ Model expects features the API does not accept: {sorted(unknown_features)}")
+        model_loaded = False
+        model = None
+    else:
+        _FEATURE_ORDER = tuple(model.feature_names_in_)
+
+def _to_features(data: StudyTimeInput) -> np.ndarray:
+    """Convert a request body into a (1, n_features) float32 feature row"""
+    return np.fromiter(
+        (getattr(data, name) for name in _FEATURE_ORDER),
+        dtype=np.float32,
+        count=len(_FEATURE_ORDER)
+    ).reshape(1, -1)
+
+# Warm the model once at import so the first request does not pay for
+# page faults and lazy initialization
+if model is not None:
+    try:
+        model.predict(np.zeros((1, len(_FEATURE_ORDER)), dtype=np.float32))
+    except Exception as e:
+        print(f"⚠️  Model warm-up failed: {str(e)}")
+
+# Key influencing factor rules: (field, comparison, threshold, message)
+_FACTOR_RULES = (
+    ("failures", operator.eq, 0, "Low failures"),
+    ("higher", operator.eq, 1, "High motivation"),
+    ("health", operator.ge, 4, "Good health"),
+    ("absences", operator.gt, 10, "High absences affecting study time"),
+)
+
+# Recommendations for < 1, < 2 and >= 2 predicted hours/day
+_RECOMMENDATIONS = (
+    "Try to dedicate more daily study time and reduce distractions.",
+    "Maintain current study pattern, focus on building consistent daily habits.",
+    "Great! Keep up the good work, aim for balance between study and rest.",
+)
+
+# Dummy confidence values (80-95%) drawn once up front and cycled through
+_CONFIDENCE_BUF_SIZE = 4096  # power of two so the index can be masked
+_CONFIDENCE_BUF = np.empty(_CONFIDENCE_BUF_SIZE, dtype=np.int32)
+_confidence_idx = itertools.count()
+
+def _fill_confidence_buf():
+    _CONFIDENCE_BUF[:] = np.random.default_rng().integers(80, 96, size=_CONFIDENCE_BUF_SIZE)
+
+_fill_confidence_buf()
+# Workers forked by gunicorn --preload would otherwise all replay the
+# master's sequence; draw a fresh one in each child (not available on Windows)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_fill_confidence_buf)
+
+# Micro-batching: requests arriving within a short window share one
+# model.predict call instead of paying its fixed overhead one row at a time
+_BATCH_WINDOW = 0.005  # seconds
+_MAX_BATCH_SIZE = 64
+_batch_queue = None
+_batch_task = None
+
+# Largest body /predict_batch accepts; longer lists are rejected with a 422
+_MAX_BATCH_REQUEST_SIZE = 1000
+
+async def _batch_worker():
+    """Collect queued feature rows and predict them as a single batch"""
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await _batch_queue.get()]
+        await asyncio.sleep(_BATCH_WINDOW)
+        while len(items) < _MAX_BATCH_SIZE and not _batch_queue.empty():
+            items.append(_batch_queue.get_nowait())
+
+        rows = np.vstack([row for row, _ in items])
+        try:
+            predictions = await loop.run_in_executor(None, model.predict, rows)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), prediction in zip(items, predictions):
+                if not future.done():
+                    future.set_result(float(prediction))
+
+def _ensure_batch_worker():
+    """Start the batch worker on the running loop if it is not already there"""
+    # Started lazily rather than at startup so prediction also works when
+    # lifespan events never run (TestClient without `with`, --lifespan off,
+    # embedding the app); a new loop gets a fresh queue and worker
+    global _batch_queue, _batch_task
+    loop = asyncio.get_running_loop()
+    if _batch_task is None or _batch_task.done() or _batch_task.get_loop() is not loop:
+        _batch_queue = asyncio.Queue()
+        _batch_task = loop.create_task(_batch_worker())
+
+async def _predict(features: np.ndarray) -> float:
+    """Queue one feature row for the batch worker and wait for its prediction"""
+    _ensure_batch_worker()
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((features, future))
+    return await future
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    _ensure_batch_worker()
+    yield
+    if _batch_task is not None:
+        _batch_task.cancel()
+
 # Initialize API
-app = FastAPI(title="Study Planner Prediction API")
+app = FastAPI(title="Study Planner Prediction API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return ORJSONResponse(status_code=500, content={"detail": f"Internal server error: {str(exc)}"})
+
+def _build_result(data: StudyTimeInput, prediction: float) -> dict:
+    """Turn a raw model prediction into the API response body"""
+    prediction = round(prediction, 2)
+
+    # Confidence (dummy range for now)
+    confidence = int(_CONFIDENCE_BUF[next(_confidence_idx) & (_CONFIDENCE_BUF_SIZE - 1)])
+
+    # Key influencing factors (simple rule-based logic)
+    factors = [
+        message for field, compare, threshold, message in _FACTOR_RULES
+        if compare(getattr(data, field), threshold)
+    ]
+
+    # Personalized recommendation
+    recommendation = _RECOMMENDATIONS[0 if prediction < 1 else 1 if prediction < 2 else 2]
+
+    return {
+        "predicted_study_time": f"{prediction} hours/day",
+        "confidence_level": f"{confidence}%",
+        "key_influencing_factors": factors,
+        "recommendation": recommendation
+    }
 
 @app.post("/predict")
-def predict_studytime(data: StudyTimeInput):
+async def predict_studytime(data: StudyTimeInput):
     # Check if model is loaded
     if not model_loaded or model is None:
         raise HTTPException(status_code=503, detail="Model not loaded. Please ensure study_time_model.pkl exists.")
     
+    # Convert input to a feature row
+    features = _to_features(data)
+
+    # Predict
     try:
-        # Convert input to DataFrame
-        features = pd.DataFrame([data.dict()])
-
-        # Predict
-        prediction = model.predict(features)[0]
-        prediction = round(float(prediction), 2)
-
-        # Confidence (dummy range for now)
-        confidence = random.randint(80, 95)
-
-        # Key influencing factors (simple rule-based logic)
-        factors = []
-        if data.failures == 0:
-            factors.append("Low failures")
-        if data.higher == 1:
-            factors.append("High motivation")
-        if data.health >= 4:
-            factors.append("Good health")
-        if data.absences > 10:
-            factors.append("High absences affecting study time")
-
-        # Personalized recommendation
-        if prediction < 1:
-            recommendation = "Try to dedicate more daily study time and reduce distractions."
-        elif prediction < 2:
-            recommendation = "Maintain current study pattern, focus on building consistent daily habits."
-        else:
-            recommendation = "Great! Keep up the good work, aim for balance between study and rest."
-
-        # Return JSON
-        return {
-            "predicted_study_time": f"{prediction} hours/day",
-            "confidence_level": f"{confidence}%",
-            "key_influencing_factors": factors,
-            "recommendation": recommendation
-        }
-    except Exception as e:
+        prediction = await _predict(features)
+    except ValueError as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
+    # Return JSON (already JSON-native, so skip FastAPI's encoder pass)
+    return ORJSONResponse(_build_result(data, prediction))
+
+@app.post("/predict_batch")
+async def predict_studytime_batch(data: Annotated[List[StudyTimeInput], Body(max_length=_MAX_BATCH_REQUEST_SIZE)]):
+    # Check if model is loaded
+    if not model_loaded or model is None:
+        raise HTTPException(status_code=503, detail="Model not loaded. Please ensure study_time_model.pkl exists.")
+    
+    if not data:
+        return ORJSONResponse([])
+
+    # The whole request is already a batch, so predict it in one call
+    # directly rather than through the micro-batch queue
+    features = np.vstack([_to_features(row) for row in data])
+    try:
+        predictions = await asyncio.get_running_loop().run_in_executor(None, model.predict, features)
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
+
+    return ORJSONResponse([
+        _build_result(row, float(prediction)) for row, prediction in zip(data, predictions)
+    ])
+
 @app.get("/")
 def read_root():
     return {"message": "Study Planner Prediction API is running! Use /docs for interactive documentation."}
 
+# How long /health may reuse its model file check, in seconds
+_MODEL_STAT_TTL = 60
+
+@functools.lru_cache(maxsize=1)
+def _model_file_exists(ttl_bucket: int) -> bool:
+    """Check for the model files at most once per TTL bucket"""
+    return os.path.exists(MODEL_PATH) or os.path.exists(ONNX_MODEL_PATH)
+
 @app.get("/health")
 def health_check():
     return {
         "status": "healthy" if model_loaded else "model_missing",
         "model_loaded": model_loaded,
-        "model_file_exists": os.path.exists("study_time_model.pkl")
+        "model_file_exists": _model_file_exists(int(time.time()) // _MODEL_STAT_TTL)
     }
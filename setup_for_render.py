@@ -6,6 +6,7 @@ Prepares your project for Render deployment
 
 import os
 import sys
+import time
 import subprocess
 from pathlib import Path
 
@@ -23,9 +24,12 @@ def check_render_requirements():
         '.gitignore'
     ]
     
+    # One directory read instead of a stat() per file
+    present = {entry.name for entry in os.scandir('.')}
+    
     all_good = True
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"✅ {file}")
         else:
             print(f"❌ {file} - MISSING!")
@@ -40,13 +44,21 @@ def check_git_status():
     print("=" * 30)
     
     try:
-        result = subprocess.run(['git', 'status'], capture_output=True, text=True)
-        if result.returncode == 0:
+        # Both queries are independent, so run them concurrently
+        status_process = subprocess.Popen(
+            ['git', 'status'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        remote_process = subprocess.Popen(
+            ['git', 'remote', '-v'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        status_process.communicate()
+        remote_output, _ = remote_process.communicate()
+        
+        if status_process.returncode == 0:
             print("✅ Git repository initialized")
             
             # Check if remote is set
-            remote_result = subprocess.run(['git', 'remote', '-v'], capture_output=True, text=True)
-            if 'origin' in remote_result.stdout:
+            if 'origin' in remote_output:
                 print("✅ Remote repository configured")
                 return True
             else:
@@ -61,10 +73,9 @@ def check_git_status():
 
 def create_git_commands():
     """Generate git commands for setup"""
-    print("\n📝 Git Setup Commands")
-    print("=" * 30)
-    
-    commands = [
+    lines = [
+        "\n📝 Git Setup Commands",
+        "=" * 30,
         "# Initialize git repository (if not already done)",
         "git init",
         "",
@@ -84,15 +95,13 @@ def create_git_commands():
         "git push -u origin main"
     ]
     
-    for cmd in commands:
-        print(cmd)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def show_render_steps():
     """Show Render deployment steps"""
-    print("\n🚀 Render Deployment Steps")
-    print("=" * 35)
-    
-    steps = [
+    lines = [
+        "\n🚀 Render Deployment Steps",
+        "=" * 35,
         "1. Go to https://render.com/",
         "2. Sign up with GitHub account",
         "3. Click 'New' → 'Web Service'",
@@ -108,8 +117,7 @@ def show_render_steps():
         "8. Test your API at: https://your-app-name.onrender.com"
     ]
     
-    for step in steps:
-        print(step)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def test_local_api():
     """Test if local API is working"""
@@ -118,20 +126,34 @@ def test_local_api():
     
     try:
         import requests
-        import time
-        import subprocess
-        import sys
         
         print("Starting local API...")
         process = subprocess.Popen([
             sys.executable, '-m', 'uvicorn', 
             'main:app', '--host', '127.0.0.1', '--port', '8000'
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Wait for API to start
-        time.sleep(3)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         try:
+            # Wait for API to start, polling with exponential backoff until it
+            # answers, the server process exits, or the deadline passes
+            ready = False
+            delay = 0.1
+            deadline = time.monotonic() + 5
+            while not ready and process.poll() is None and time.monotonic() < deadline:
+                try:
+                    requests.get('http://127.0.0.1:8000/health', timeout=0.5)
+                    ready = True
+                except requests.exceptions.RequestException:
+                    time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                    delay *= 2
+            
+            if not ready:
+                if process.poll() is not None:
+                    print("❌ API server exited during startup")
+                else:
+                    print("❌ API did not start within 5 seconds")
+                return
+            
             # Test health endpoint
             response = requests.get('http://127.0.0.1:8000/health', timeout=5)
             if response.status_code == 200:
@@ -8,8 +8,19 @@ import os
 import subprocess
 import sys
 
+COMMIT_MESSAGE = "Initial commit - Study Time Prediction API for Render deployment"
+
+# Capture git's output instead of echoing it; on failure it holds the reason
+# (e.g. "nothing to commit" goes to stdout, not stderr)
+GIT_OUTPUT = {'stdout': subprocess.PIPE, 'stderr': subprocess.STDOUT, 'text': True}
+
+def print_git_output(output):
+    """Print captured git output indented under an error message"""
+    for line in (output or '').strip().splitlines():
+        print(f"   {line}")
+
 def configure_git():
-    """Configure Git identity"""
+    """Ask for the Git identity to commit with"""
     print("🔧 Configuring Git Identity")
     print("=" * 40)
     
@@ -19,18 +30,9 @@ def configure_git():
     
     if not name or not email:
         print("❌ Name and email are required!")
-        return False
+        return None
     
-    try:
-        # Configure Git
-        subprocess.run(['git', 'config', '--global', 'user.name', name], check=True)
-        subprocess.run(['git', 'config', '--global', 'user.email', email], check=True)
-        
-        print("✅ Git identity configured successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error configuring Git: {e}")
-        return False
+    return name, email
 
 def check_git_status():
     """Check current Git status"""
@@ -56,44 +58,31 @@ def check_git_status():
         print(f"❌ Error checking Git status: {e}")
         return False
 
-def stage_files():
-    """Stage all files for commit"""
-    print("\n📦 Staging Files")
-    print("=" * 20)
-    
-    try:
-        subprocess.run(['git', 'add', '.'], check=True)
-        print("✅ All files staged successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error staging files: {e}")
-        return False
-
-def commit_files():
-    """Commit staged files"""
-    print("\n💾 Committing Files")
+def commit_project(name, email):
+    """Configure Git identity, commit all files and set up the main branch"""
+    print("\n📦 Committing Files")
     print("=" * 25)
     
-    try:
-        commit_message = "Initial commit - Study Time Prediction API for Render deployment"
-        subprocess.run(['git', 'commit', '-m', commit_message], check=True)
-        print("✅ Files committed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error committing files: {e}")
-        return False
-
-def setup_branch():
-    """Set up main branch"""
-    print("\n🌿 Setting up Main Branch")
-    print("=" * 30)
+    commands = [
+        ['git', 'config', '--global', 'user.name', name],
+        ['git', 'config', '--global', 'user.email', email],
+        ['git', 'add', '.'],
+        ['git', 'commit', '-m', COMMIT_MESSAGE],
+        ['git', 'branch', '-M', 'main'],
+    ]
     
     try:
-        subprocess.run(['git', 'branch', '-M', 'main'], check=True)
+        for command in commands:
+            subprocess.run(command, check=True, **GIT_OUTPUT)
+        
+        print("✅ Git identity configured successfully!")
+        print("✅ Files committed successfully!")
         print("✅ Main branch set up successfully!")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error setting up branch: {e}")
+        # The command itself is not echoed: it contains the user's name and email
+        print(f"❌ Error committing files (exit code {e.returncode})")
+        print_git_output(e.output)
         return False
 
 def get_github_url():
@@ -128,11 +117,12 @@ def add_remote(github_url):
     print("=" * 25)
     
     try:
-        subprocess.run(['git', 'remote', 'add', 'origin', github_url], check=True)
+        subprocess.run(['git', 'remote', 'add', 'origin', github_url], check=True, **GIT_OUTPUT)
         print("✅ GitHub remote added successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Error adding remote: {e}")
+        print_git_output(e.output)
         return False
 
 def push_to_github():
@@ -141,6 +131,7 @@ def push_to_github():
     print("=" * 20)
     
     try:
+        # Output is left on the terminal so progress of a long push stays visible
         subprocess.run(['git', 'push', '-u', 'origin', 'main'], check=True)
         print("✅ Successfully pushed to GitHub!")
         return True
@@ -153,63 +144,60 @@ def push_to_github():
 
 def show_next_steps():
     """Show next steps for Render deployment"""
-    print("\n🎉 GitHub Setup Complete!")
-    print("=" * 30)
-    print("📖 Next steps for Render deployment:")
-    print()
-    print("1. 🎨 Go to https://render.com/")
-    print("2. 📝 Sign up with GitHub account")
-    print("3. 🚀 Click 'New' → 'Web Service'")
-    print("4. 🔗 Connect your GitHub repository")
-    print("5. ⚙️  Configure:")
-    print("   - Name: study-time-api")
-    print("   - Environment: Docker")
-    print("   - Branch: main")
-    print("   - Build Command: (leave empty)")
-    print("   - Start Command: (leave empty)")
-    print("6. 🎯 Click 'Create Web Service'")
-    print("7. ⏳ Wait for deployment (5-10 minutes)")
-    print("8. 🧪 Test your API at: https://your-app-name.onrender.com")
-    print()
-    print("📚 For detailed instructions, see: RENDER_DEPLOYMENT_GUIDE.md")
+    lines = [
+        "\n🎉 GitHub Setup Complete!",
+        "=" * 30,
+        "📖 Next steps for Render deployment:",
+        "",
+        "1. 🎨 Go to https://render.com/",
+        "2. 📝 Sign up with GitHub account",
+        "3. 🚀 Click 'New' → 'Web Service'",
+        "4. 🔗 Connect your GitHub repository",
+        "5. ⚙️  Configure:",
+        "   - Name: study-time-api",
+        "   - Environment: Docker",
+        "   - Branch: main",
+        "   - Build Command: (leave empty)",
+        "   - Start Command: (leave empty)",
+        "6. 🎯 Click 'Create Web Service'",
+        "7. ⏳ Wait for deployment (5-10 minutes)",
+        "8. 🧪 Test your API at: https://your-app-name.onrender.com",
+        "",
+        "📚 For detailed instructions, see: RENDER_DEPLOYMENT_GUIDE.md",
+    ]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     print("🚀 GitHub Setup for Render Deployment")
     print("=" * 50)
     
-    # Step 1: Configure Git
-    if not configure_git():
+    # Step 1: Ask for Git identity
+    identity = configure_git()
+    if not identity:
         return
     
     # Step 2: Check status
     check_git_status()
     
-    # Step 3: Stage files
-    if not stage_files():
-        return
-    
-    # Step 4: Commit files
-    if not commit_files():
-        return
-    
-    # Step 5: Setup branch
-    if not setup_branch():
+    # Step 3: Configure identity, stage, commit and set up main branch
+    if not commit_project(*identity):
         return
     
-    # Step 6: Get GitHub URL
+    # Step 4: Get GitHub URL
     github_url = get_github_url()
     if not github_url:
         return
     
-    # Step 7: Add remote
+    # Step 5: Add remote
     if not add_remote(github_url):
         return
     
-    # Step 8: Push to GitHub
+    # Step 6: Push to GitHub
     if not push_to_github():
         return
     
-    # Step 9: Show next steps
+    # Step 7: Show next steps
     show_next_steps()
 
 if __name__ == "__main__":
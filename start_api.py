@@ -3,25 +3,26 @@
 Study Time Prediction API Startup Script
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import pandas
-        import numpy
-        import joblib
-        import sklearn
-        print("✅ All dependencies are installed!")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # find_spec locates each package without importing it; the server runs
+    # in a child process, so importing them here would be wasted work
+    missing = [
+        name for name in ("fastapi", "uvicorn", "orjson", "numpy", "joblib", "sklearn")
+        if importlib.util.find_spec(name) is None
+    ]
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
+    
+    print("✅ All dependencies are installed!")
+    return True
 
 def check_model_file():
     """Check if the model file exists"""
@@ -4,17 +4,47 @@ Easy integration for your AI Study Planner project
 """
 
 import requests
+import urllib3
 import json
-from typing import Dict, Any, Optional
+import time
+import functools
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
-@dataclass
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library encoder
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Transport failures from either the requests or the urllib3 code path
+_REQUEST_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+
+@dataclass(frozen=True)
 class StudyPrediction:
     """Study time prediction result"""
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = ('predicted_study_time', 'confidence_level', 'key_influencing_factors', 'recommendation')
+    
     predicted_study_time: str
     confidence_level: str
     key_influencing_factors: list
     recommendation: str
+    
+    # Frozen instances cannot be restored through __setattr__, so copy and
+    # pickle need explicit state handling (slots=True generates the same)
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 class StudyTimeAPIClient:
     """
@@ -30,17 +60,36 @@ class StudyTimeAPIClient:
         print(prediction.predicted_study_time)
     """
     
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 30):
+    # Features every prediction request must include
+    _REQUIRED = frozenset({
+        'failures', 'higher', 'absences', 'freetime', 'goout',
+        'famrel', 'famsup', 'schoolsup', 'paid', 'traveltime',
+        'health', 'internet', 'age'
+    })
+    
+    # Most rows the server accepts in one /predict_batch request
+    _MAX_BATCH_SIZE = 1000
+    
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 30,
+                 use_urllib3: bool = False):
         """
         Initialize the API client
         
         Args:
             base_url: Base URL of the API (e.g., "http://localhost:8000")
             timeout: Request timeout in seconds
+            use_urllib3: Send requests through a bare urllib3 pool, skipping
+                the requests session machinery for lower per-call overhead
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.session = requests.Session()
+        self.pool = urllib3.PoolManager(num_pools=1, maxsize=4, retries=False) if use_urllib3 else None
+        
+        # Cached is_available() result and when it was taken (monotonic clock)
+        self._avail_ttl = 1.0
+        self._avail_ts = 0.0
+        self._avail_val = False
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -50,10 +99,8 @@ class StudyTimeAPIClient:
             Health status information
         """
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return _json_loads(self._request('GET', '/health'))
+        except (*_REQUEST_ERRORS, ValueError) as e:
             raise ConnectionError(f"API health check failed: {e}")
     
     def predict_study_time(self, **features) -> StudyPrediction:
@@ -70,38 +117,119 @@ class StudyTimeAPIClient:
             ValueError: If required features are missing
             ConnectionError: If API request fails
         """
+        return self.predict_prepared(self.prepare(**features))
+    
+    def prepare(self, **features) -> bytes:
+        """
+        Validate features and encode them into a reusable request body
+        
+        Useful when the same features are sent repeatedly (retries,
+        benchmarks), since validation and encoding happen only once.
+        
+        Args:
+            **features: Student features (failures, higher, absences, etc.)
+        
+        Returns:
+            Encoded JSON body to pass to predict_prepared
+        
+        Raises:
+            ValueError: If required features are missing
+        """
         # Validate required features
-        required_features = {
-            'failures', 'higher', 'absences', 'freetime', 'goout',
-            'famrel', 'famsup', 'schoolsup', 'paid', 'traveltime',
-            'health', 'internet', 'age'
-        }
+        if not features.keys() >= self._REQUIRED:
+            missing_features = self._REQUIRED.difference(features)
+            raise ValueError(f"Missing required features: {set(missing_features)}")
         
-        missing_features = required_features - set(features.keys())
-        if missing_features:
-            raise ValueError(f"Missing required features: {missing_features}")
+        return _json_dumps(features)
+    
+    def predict_prepared(self, body: bytes) -> StudyPrediction:
+        """
+        Predict study time from a body built by prepare
         
+        Args:
+            body: Encoded JSON body returned by prepare
+        
+        Returns:
+            StudyPrediction object with prediction results
+        
+        Raises:
+            ConnectionError: If API request fails
+        """
         try:
-            response = self.session.post(
-                f"{self.base_url}/predict",
-                json=features,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+            data = _json_loads(self._request('POST', '/predict', body))
+            return self._parse_prediction(data)
             
-            data = response.json()
-            return StudyPrediction(
-                predicted_study_time=data['predicted_study_time'],
-                confidence_level=data['confidence_level'],
-                key_influencing_factors=data['key_influencing_factors'],
-                recommendation=data['recommendation']
-            )
-            
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
+            # Force the next is_available() call to probe the API again
+            self._avail_ts = 0.0
             raise ConnectionError(f"Prediction request failed: {e}")
-        except KeyError as e:
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid API response format: {e}")
+    
+    def predict_batch(self, rows: List[Dict[str, Any]]) -> List[StudyPrediction]:
+        """
+        Predict study time for several students in a single request
+        
+        Lists longer than the server's per-request limit are split into
+        several requests.
+        
+        Args:
+            rows: List of feature dictionaries, one per student
+        
+        Returns:
+            List of StudyPrediction objects, in the same order as rows
+        
+        Raises:
+            ValueError: If any row is missing required features
+            ConnectionError: If API request fails
+        """
+        missing_features = next(
+            (self._REQUIRED.difference(row) for row in rows if not row.keys() >= self._REQUIRED),
+            None
+        )
+        if missing_features:
+            raise ValueError(f"Missing required features: {set(missing_features)}")
+        
+        try:
+            predictions = []
+            for start in range(0, len(rows), self._MAX_BATCH_SIZE):
+                chunk = rows[start:start + self._MAX_BATCH_SIZE]
+                content = self._request('POST', '/predict_batch', _json_dumps(chunk))
+                predictions.extend(self._parse_prediction(data) for data in _json_loads(content))
+            return predictions
+            
+        except _REQUEST_ERRORS as e:
+            # Force the next is_available() call to probe the API again
+            self._avail_ts = 0.0
+            raise ConnectionError(f"Batch prediction request failed: {e}")
+        except (KeyError, ValueError) as e:
             raise ValueError(f"Invalid API response format: {e}")
     
+    def _request(self, method: str, path: str, body: Optional[bytes] = None) -> bytes:
+        """Send a request and return the raw response body, raising on HTTP errors"""
+        url = f"{self.base_url}{path}"
+        headers = _JSON_HEADERS if body is not None else None
+        
+        if self.pool is not None:
+            response = self.pool.request(method, url, body=body, headers=headers, timeout=self.timeout)
+            if response.status >= 400:
+                raise requests.exceptions.HTTPError(f"{response.status} Error for url: {url}")
+            return response.data
+        
+        response = self.session.request(method, url, data=body, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+    
+    @staticmethod
+    def _parse_prediction(data: Dict[str, Any]) -> StudyPrediction:
+        """Build a StudyPrediction from one prediction response body"""
+        return StudyPrediction(
+            predicted_study_time=data['predicted_study_time'],
+            confidence_level=data['confidence_level'],
+            key_influencing_factors=data['key_influencing_factors'],
+            recommendation=data['recommendation']
+        )
+    
     def predict_study_time_dict(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """
         Predict study time using a dictionary of features
@@ -124,14 +252,25 @@ class StudyTimeAPIClient:
         """
         Check if the API is available
         
+        The result is cached for a short time so repeated probes do not
+        each cost a round trip.
+        
         Returns:
             True if API is available, False otherwise
         """
+        now = time.monotonic()
+        if now - self._avail_ts < self._avail_ttl:
+            return self._avail_val
+        
         try:
             self.health_check()
-            return True
-        except:
-            return False
+            available = True
+        except (ConnectionError, requests.exceptions.RequestException):
+            available = False
+        
+        self._avail_ts = now
+        self._avail_val = available
+        return available
     
     def get_api_info(self) -> Dict[str, Any]:
         """
@@ -144,14 +283,27 @@ class StudyTimeAPIClient:
             'base_url': self.base_url,
             'docs_url': f"{self.base_url}/docs",
             'health_url': f"{self.base_url}/health",
-            'prediction_url': f"{self.base_url}/predict"
+            'prediction_url': f"{self.base_url}/predict",
+            'batch_prediction_url': f"{self.base_url}/predict_batch"
         }
 
 # Convenience functions for quick usage
+@functools.lru_cache(maxsize=16)
+def _get_client(base_url: str, timeout: int = 30) -> StudyTimeAPIClient:
+    """
+    Return a shared client for a base URL
+    
+    Callers using the same URL share one client, so its session and
+    keep-alive connections are reused across calls.
+    """
+    return StudyTimeAPIClient(base_url, timeout)
+
 def quick_prediction(api_url: str, **features) -> StudyPrediction:
     """
     Quick prediction without creating a client instance
     
+    Reuses a cached client (and its connection pool) per API URL.
+    
     Args:
         api_url: API base URL
         **features: Student features
@@ -159,20 +311,22 @@ def quick_prediction(api_url: str, **features) -> StudyPrediction:
     Returns:
         StudyPrediction object
     """
-    client = StudyTimeAPIClient(api_url)
+    client = _get_client(api_url)
     return client.predict_study_time(**features)
 
 def check_api_health(api_url: str) -> bool:
     """
     Quick health check without creating a client instance
     
+    Reuses a cached client (and its connection pool) per API URL.
+    
     Args:
         api_url: API base URL
     
     Returns:
         True if API is healthy, False otherwise
     """
-    client = StudyTimeAPIClient(api_url)
+    client = _get_client(api_url)
     return client.is_available()
 
 # Example usage
@@ -1,46 +1,71 @@
+import asyncio
+import copy
+import pickle
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
-def test_study_time_prediction():
-    """Test the study time prediction API endpoint"""
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+BASE_URL = "http://127.0.0.1:8000"
+
+# Shared session so both checks reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Sample test data
+TEST_DATA = {
+    "failures": 0,
+    "higher": 1,
+    "absences": 3,
+    "freetime": 2,
+    "goout": 3,
+    "famrel": 4,
+    "famsup": 1,
+    "schoolsup": 0,
+    "paid": 1,
+    "traveltime": 2,
+    "health": 5,
+    "internet": 1,
+    "age": 17
+}
+
+def report_prediction(response):
+    """Print the outcome of a /predict response"""
     
-    # API endpoint
-    url = "http://127.0.0.1:8000/predict"
+    # Check if request was successful
+    if response.status_code == 200:
+        result = response.json()
+        print("✅ API Test Successful!")
+        print("\n📊 Prediction Results:")
+        print(f"   Study Time: {result['predicted_study_time']}")
+        print(f"   Confidence: {result['confidence_level']}")
+        print(f"   Key Factors: {', '.join(result['key_influencing_factors'])}")
+        print(f"   Recommendation: {result['recommendation']}")
+    else:
+        print(f"❌ API Test Failed! Status Code: {response.status_code}")
+        print(f"Response: {response.text}")
+
+def report_health(response):
+    """Print the outcome of a /health response"""
     
-    # Sample test data
-    test_data = {
-        "failures": 0,
-        "higher": 1,
-        "absences": 3,
-        "freetime": 2,
-        "goout": 3,
-        "famrel": 4,
-        "famsup": 1,
-        "schoolsup": 0,
-        "paid": 1,
-        "traveltime": 2,
-        "health": 5,
-        "internet": 1,
-        "age": 17
-    }
+    if response.status_code == 200:
+        print("✅ Health Check: API is running!")
+        print(f"   Status: {response.json()}")
+    else:
+        print(f"❌ Health Check Failed: {response.status_code}")
+
+def test_study_time_prediction():
+    """Test the study time prediction API endpoint"""
     
     try:
         # Make POST request
-        response = requests.post(url, json=test_data)
+        response = SESSION.post(f"{BASE_URL}/predict", json=TEST_DATA)
+        report_prediction(response)
         
-        # Check if request was successful
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ API Test Successful!")
-            print("\n📊 Prediction Results:")
-            print(f"   Study Time: {result['predicted_study_time']}")
-            print(f"   Confidence: {result['confidence_level']}")
-            print(f"   Key Factors: {', '.join(result['key_influencing_factors'])}")
-            print(f"   Recommendation: {result['recommendation']}")
-        else:
-            print(f"❌ API Test Failed! Status Code: {response.status_code}")
-            print(f"Response: {response.text}")
-            
     except requests.exceptions.ConnectionError:
         print("❌ Connection Error: Make sure the API server is running!")
         print("   Run: uvicorn main:app --reload")
@@ -51,22 +76,68 @@ def test_health_endpoint():
     """Test the health check endpoint"""
     
     try:
-        response = requests.get("http://127.0.0.1:8000/health")
-        if response.status_code == 200:
-            print("✅ Health Check: API is running!")
-            print(f"   Status: {response.json()}")
-        else:
-            print(f"❌ Health Check Failed: {response.status_code}")
+        response = SESSION.get(f"{BASE_URL}/health")
+        report_health(response)
     except requests.exceptions.ConnectionError:
         print("❌ Health Check: API server not running")
 
+def test_prediction_copy_and_pickle():
+    """StudyPrediction results survive copy, deepcopy and pickle"""
+    from study_api_client import StudyPrediction
+    
+    prediction = StudyPrediction(
+        predicted_study_time="2.5 hours/day",
+        confidence_level="87%",
+        key_influencing_factors=["Low failures", "Good health"],
+        recommendation="Great! Keep up the good work, aim for balance between study and rest."
+    )
+    
+    assert copy.copy(prediction) == prediction
+    deep = copy.deepcopy(prediction)
+    assert deep == prediction
+    assert deep.key_influencing_factors is not prediction.key_influencing_factors
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(prediction, protocol)) == prediction
+
+async def run_tests():
+    """Run the health and prediction checks concurrently"""
+    
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=5) as client:
+        health, prediction = await asyncio.gather(
+            client.get("/health"),
+            client.post("/predict", json=TEST_DATA),
+            return_exceptions=True
+        )
+    
+    if isinstance(health, httpx.ConnectError):
+        print("❌ Health Check: API server not running")
+    elif isinstance(health, Exception):
+        print(f"❌ Error: {str(health)}")
+    else:
+        report_health(health)
+    print()
+    
+    if isinstance(prediction, httpx.ConnectError):
+        print("❌ Connection Error: Make sure the API server is running!")
+        print("   Run: uvicorn main:app --reload")
+    elif isinstance(prediction, Exception):
+        print(f"❌ Error: {str(prediction)}")
+    else:
+        report_prediction(prediction)
+
 if __name__ == "__main__":
     print("🧪 Testing Study Time Prediction API")
     print("=" * 50)
     
-    # Test health endpoint first
-    test_health_endpoint()
-    print()
-    
-    # Test prediction endpoint
-    test_study_time_prediction()
+    try:
+        if httpx is not None:
+            asyncio.run(run_tests())
+        else:
+            # Test health endpoint first
+            test_health_endpoint()
+            print()
+            
+            # Test prediction endpoint
+            test_study_time_prediction()
+    finally:
+        SESSION.close()